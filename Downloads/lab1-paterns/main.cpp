@@ -53,9 +53,9 @@ public:
         double cost = op->calcTalkCost(minutes, age);
         if (bill->canAdd(cost)) {
             bill->add(cost);
-            cout << name << " говорив з " << other.name << " протягом " << minutes << " хвилин. Вартість: " << cost << endl;
+            cout << name << " говорив з " << other.name << " протягом " << minutes << " хвилин. Вартість: " << cost << '\n';
         } else {
-            cout << name << " не може здійснити дзвінок. Ліміт перевищено." << endl;
+            cout << name << " не може здійснити дзвінок. Ліміт перевищено.\n";
         }
     }
 
@@ -64,9 +64,9 @@ public:
         double cost = op->calcMessageCost(quantity, sameOp);
         if (bill->canAdd(cost)) {
             bill->add(cost);
-            cout << name << " надіслав " << quantity << " повідомлень до " << other.name << ". Вартість: " << cost << endl;
+            cout << name << " надіслав " << quantity << " повідомлень до " << other.name << ". Вартість: " << cost << '\n';
         } else {
-            cout << name << " не може надіслати повідомлення. Ліміт перевищено." << endl;
+            cout << name << " не може надіслати повідомлення. Ліміт перевищено.\n";
         }
     }
 
@@ -74,9 +74,9 @@ public:
         double cost = op->calcNetworkCost(amount);
         if (bill->canAdd(cost)) {
             bill->add(cost);
-            cout << name << " підключився до інтернету. Використано даних: " << amount << " МБ. Вартість: " << cost << endl;
+            cout << name << " підключився до інтернету. Використано даних: " << amount << " МБ. Вартість: " << cost << '\n';
         } else {
-            cout << name << " не може підключитися до інтернету. Ліміт перевищено." << endl;
+            cout << name << " не може підключитися до інтернету. Ліміт перевищено.\n";
         }
     }
 };
@@ -140,7 +140,7 @@ int main() {
             cout << "Введіть ID клієнта і суму оплати: ";
             cin >> fromID >> amount;
             customers[fromID]->bill->pay(amount);
-            cout << "Поточний борг клієнта " << customers[fromID]->name << ": " << customers[fromID]->bill->debt << endl;
+            cout << "Поточний борг клієнта " << customers[fromID]->name << ": " << customers[fromID]->bill->debt << '\n';
         }
     } while (action != 5);
 